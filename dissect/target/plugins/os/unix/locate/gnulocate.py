@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 from typing import BinaryIO, Iterable
 
 from dissect.cstruct import cstruct
@@ -12,12 +13,19 @@ from dissect.target.plugins.os.unix.locate.locate import BaseLocatePlugin
 gnulocate_def = """
 #define MAGIC 0x004c4f43415445303200             /* b'/x00LOCATE02/x00' */
 
+#define OFFSET_ESCAPE -128                       /* 0x80, followed by an int16 offset */
+
 struct entry {
     int8 offset;
     char path[];
 }
 """
 
+# Entries are decoded by hand from a single buffer, as reading the null-terminated
+# ``entry.path`` through cstruct results in a ``read(1)`` call for every byte.
+INT8 = struct.Struct(">b")
+INT16 = struct.Struct(">h")
+
 GNULocateRecord = TargetRecordDescriptor(
     "linux/locate/gnulocate",
     [
@@ -43,29 +51,53 @@ class GNULocateFile:
 
     def __init__(self, fh: BinaryIO):
         self.fh = fh
-        self.count = 0
-        self.previous_path = ""
 
         magic = int.from_bytes(self.fh.read(10), byteorder="big")
         if magic != c_gnulocate.MAGIC:
             raise ValueError(f"Invalid Locate file magic. Expected /x00LOCATE02/x00, got {magic}")
 
     def __iter__(self) -> Iterable[GNULocateFile]:
-        try:
-            while True:
-                # NOTE: The offset could be negative, which indicates
-                # that we decrease the number of characters of the previous path.
-                entry = c_gnulocate.entry(self.fh)
-                current_filepath_end = entry.path.decode(errors="backslashreplace")
-                offset = entry.offset
-
-                self.count += offset
-
-                path = self.previous_path[0 : self.count] + current_filepath_end
-                self.previous_path = path
-                yield path
-        except EOFError:
-            return
+        buf = self.fh.read()
+        pos = 0
+        size = len(buf)
+
+        # Keep the decoding state and lookups in locals, this loop runs once for every path in the database
+        count = 0
+        length = 0
+        path = bytearray()
+        unpack_offset = INT8.unpack_from
+        offset_escape = c_gnulocate.OFFSET_ESCAPE
+        find = buf.find
+
+        while pos < size:
+            # NOTE: The offset could be negative, which indicates
+            # that we decrease the number of characters of the previous path.
+            (offset,) = unpack_offset(buf, pos)
+            pos += 1
+
+            # Offsets that do not fit in an int8 are stored as an escape byte followed by an int16
+            if offset == offset_escape:
+                if pos + INT16.size > size:
+                    return
+
+                (offset,) = INT16.unpack_from(buf, pos)
+                pos += INT16.size
+
+            end = find(b"\x00", pos)
+            if end == -1:
+                return
+
+            count += offset
+            if not 0 <= count <= length:
+                raise ValueError(f"Invalid offset {offset} in locate file, prefix length {count} is out of range")
+
+            # The shared prefix is kept as bytes and truncated in place, the offset is a byte count
+            del path[count:]
+            path += buf[pos:end]
+            length = count + end - pos
+            pos = end + 1
+
+            yield path.decode(errors="backslashreplace")
 
 
 class GNULocatePlugin(BaseLocatePlugin):
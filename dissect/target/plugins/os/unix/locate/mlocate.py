@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from datetime import datetime
 from typing import BinaryIO, Iterable, Iterator
@@ -49,6 +50,9 @@ struct entry {
 
 @dataclass
 class MLocate:
+    # One instance is created for every entry in the database, avoid a __dict__ per instance
+    __slots__ = ("ts", "ts_ns", "parent", "path", "dbe_type")
+
     ts: datetime
     ts_ns: int
     parent: str
@@ -70,6 +74,14 @@ MLocateRecord = TargetRecordDescriptor(
 
 c_mlocate = cstruct(endian=">").load(mlocate_def)
 
+# Plain integer values of the entry types, comparing the raw type byte is
+# cheaper than constructing a DBE_TYPE enum member for every entry.
+DBE_TYPE_FILE = c_mlocate.DBE_TYPE.FILE.value
+DBE_TYPE_END = c_mlocate.DBE_TYPE.END.value
+
+# The fixed size fields of a directory_entry: time_seconds, time_nanoseconds and padding
+DIRECTORY_HEADER = struct.Struct(">qi4x")
+
 
 class MLocateFile:
     """mlocate file parser
@@ -87,32 +99,54 @@ class MLocateFile:
 
         self.header = c_mlocate.header_config(self.fh)
 
-    def _parse_directory_entries(self) -> Iterator[str, c_mlocate.entry]:
-        while (dbe_type := c_mlocate.DBE_TYPE(self.fh)) != c_mlocate.DBE_TYPE.END:
-            entry = c_mlocate.entry(self.fh)
-            dbe_type = "file" if dbe_type == c_mlocate.DBE_TYPE.FILE else "directory"
-
-            yield dbe_type, entry
-
     def __iter__(self) -> Iterable[MLocateFile]:
-        while True:
-            try:
-                directory_entry = c_mlocate.directory_entry(self.fh)
-                parent = directory_entry.path.decode()
-
-                for dbe_type, file_entry in self._parse_directory_entries():
-                    file_path = file_entry.path.decode()
-
-                    yield MLocate(
-                        ts=from_unix(directory_entry.time_seconds),
-                        ts_ns=directory_entry.time_nanoseconds,
-                        parent=parent,
-                        path=file_path,
-                        dbe_type=dbe_type,
-                    )
-            except EOFError:
+        # NOTE: The entries are parsed from a single buffer, as reading the null-terminated
+        # paths through cstruct results in a ``read(1)`` call for every byte.
+        buf = self.fh.read()
+        pos = 0
+        size = len(buf)
+
+        # Bind the lookups used for every entry to locals
+        find = buf.find
+        unpack_header = DIRECTORY_HEADER.unpack_from
+        header_size = DIRECTORY_HEADER.size
+
+        while pos + header_size <= size:
+            # Unpack the fixed size directory fields in one call instead of parsing a directory_entry struct
+            time_seconds, time_nanoseconds = unpack_header(buf, pos)
+            pos += header_size
+
+            if (end := find(b"\x00", pos)) == -1:
                 return
 
+            path_start = pos
+            pos = end + 1
+
+            # Directories without any entries yield nothing, so don't bother decoding their path and timestamp
+            if pos < size and buf[pos] == DBE_TYPE_END:
+                pos += 1
+                continue
+
+            parent = buf[path_start:end].decode()
+            # The timestamp belongs to the directory, so only convert it once for all its entries
+            ts = from_unix(time_seconds)
+
+            while pos < size and (dbe_type := buf[pos]) != DBE_TYPE_END:
+                if (end := find(b"\x00", pos + 1)) == -1:
+                    return
+
+                yield MLocate(
+                    ts=ts,
+                    ts_ns=time_nanoseconds,
+                    parent=parent,
+                    path=buf[pos + 1 : end].decode(),
+                    dbe_type="file" if dbe_type == DBE_TYPE_FILE else "directory",
+                )
+                pos = end + 1
+
+            # Skip the END entry of this directory
+            pos += 1
+
 
 class MLocatePlugin(BaseLocatePlugin):
     __namespace__ = "mlocate"
@@ -136,13 +170,19 @@ class MLocatePlugin(BaseLocatePlugin):
         mlocate_fh = self.target.fs.path(self.path).open()
         mlocate_file = MLocateFile(mlocate_fh)
 
+        parent_path = parent = None
+
         for item in mlocate_file:
-            parent = self.target.fs.path(item.parent)
+            # Entries are grouped per directory, only create a new parent path when the directory changes
+            if item.parent != parent_path:
+                parent_path = item.parent
+                parent = self.target.fs.path(parent_path)
+
             yield MLocateRecord(
                 ts=item.ts,
                 ts_ns=item.ts_ns,
                 parent=parent,
-                path=parent.joinpath(item.path),
+                path=parent / item.path,
                 type=item.dbe_type,
                 source=self.path,
                 _target=self.target,
@@ -1,29 +1,57 @@
+from io import BytesIO
+
+import pytest
+
 from dissect.target.filesystem import VirtualFilesystem
 from dissect.target.plugins.os.unix.locate.gnulocate import (
+    GNULocateFile,
     GNULocatePlugin,
     GNULocateRecord,
 )
 from dissect.target.target import Target
 from tests._utils import absolute_path
 
+GNULocateRecordType = GNULocateRecord.recordType
 
-def test_gnulocate(target_unix: Target, fs_unix: VirtualFilesystem) -> None:
+
+@pytest.mark.parametrize(
+    "namespace",
+    [
+        "gnulocate",
+        # test namespace plugin
+        "locate",
+    ],
+)
+def test_gnulocate(target_unix: Target, fs_unix: VirtualFilesystem, namespace: str) -> None:
     fs_unix.map_file("/var/cache/locate/locatedb", absolute_path("_data/plugins/os/unix/locate/locatedb"))
     target_unix.add_plugin(GNULocatePlugin)
 
-    records = list(target_unix.gnulocate.locate())
+    records = list(getattr(target_unix, namespace).locate())
 
     assert len(records) == 3575
-    assert isinstance(records[0], type(GNULocateRecord()))
+    assert isinstance(records[0], GNULocateRecordType)
 
     assert records[0].path.as_posix() == "/"
     assert records[1].path.as_posix() == "/.dockerenv"
 
-    # test namespace plugin
-    records = list(target_unix.locate.locate())
 
-    assert len(records) == 3575
-    assert isinstance(records[0], type(GNULocateRecord()))
+def test_gnulocate_file_multibyte_prefix() -> None:
+    # The front compression offset counts bytes, not decoded characters
+    buf = b"\x00LOCATE02\x00" + b"\x00/tmp/\xc3\xa9/x\x00" + b"\x08y\x00" + b"\xf9bin\x00"
 
-    assert records[0].path.as_posix() == "/"
-    assert records[1].path.as_posix() == "/.dockerenv"
+    assert list(GNULocateFile(BytesIO(buf))) == ["/tmp/é/x", "/tmp/é/y", "/bin"]
+
+
+def test_gnulocate_file_long_offset() -> None:
+    # Offsets outside of the int8 range are stored as 0x80 followed by an int16
+    long_dir = b"/" + b"a" * 200
+    buf = b"\x00LOCATE02\x00" + b"\x00" + long_dir + b"\x00" + b"\x80\x00\xc9/x\x00" + b"\x80\xff\x38b\x00"
+
+    assert list(GNULocateFile(BytesIO(buf))) == [long_dir.decode(), long_dir.decode() + "/x", "/b"]
+
+
+def test_gnulocate_file_invalid_offset() -> None:
+    buf = b"\x00LOCATE02\x00" + b"\x00/bin\x00" + b"\x05x\x00"
+
+    with pytest.raises(ValueError, match="Invalid offset 5 in locate file"):
+        list(GNULocateFile(BytesIO(buf)))